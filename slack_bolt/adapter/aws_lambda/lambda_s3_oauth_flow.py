@@ -4,6 +4,7 @@ from logging import Logger
 from typing import Optional
 
 import boto3
+from botocore.client import BaseClient
 
 from slack_bolt.authorization.authorize import InstallationStoreAuthorize
 from slack_bolt.oauth import OAuthFlow
@@ -16,6 +17,20 @@ from slack_bolt.util.utils import create_web_client
 
 
 class LambdaS3OAuthFlow(OAuthFlow):
+    """OAuthFlow that stores OAuth state parameters and installation data in Amazon S3.
+
+    The S3 client is shared by the state store and the installation store.
+    Create this object outside your Lambda handler function
+    so that the client's connection pool is reused across warm invocations.
+    If you need a customized client, pass it as `s3_client`:
+
+        s3_client = boto3.client(
+            "s3",
+            config=botocore.config.Config(retries={"max_attempts": 3, "mode": "standard"}),
+        )
+        oauth_flow = LambdaS3OAuthFlow(s3_client=s3_client)
+    """
+
     def __init__(
         self,
         *,
@@ -24,6 +39,7 @@ class LambdaS3OAuthFlow(OAuthFlow):
         settings: Optional[OAuthSettings] = None,
         oauth_state_bucket_name: Optional[str] = None,  # required
         installation_bucket_name: Optional[str] = None,  # required
+        s3_client: Optional[BaseClient] = None,
     ):
         logger = logger or logging.getLogger(__name__)
         settings = settings or OAuthSettings(
@@ -36,7 +52,7 @@ class LambdaS3OAuthFlow(OAuthFlow):
         installation_bucket_name = (
             installation_bucket_name or os.environ["SLACK_INSTALLATION_S3_BUCKET_NAME"]
         )
-        self.s3_client = boto3.client("s3")
+        self.s3_client = s3_client or boto3.client("s3")
         if settings.state_store is None or not isinstance(
             settings.state_store, AmazonS3OAuthStateStore
         ):
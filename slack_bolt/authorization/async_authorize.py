@@ -1,6 +1,7 @@
+import asyncio
 import inspect
 from logging import Logger
-from typing import Optional, Callable, Awaitable, Dict, Any
+from typing import Optional, Callable, Awaitable, Dict, Any, Union, List, Set
 
 from slack_sdk.errors import SlackApiError
 from slack_sdk.oauth.installation_store import Bot, Installation
@@ -9,11 +10,14 @@ from slack_sdk.oauth.installation_store.async_installation_store import (
 )
 from slack_sdk.oauth.token_rotation.async_rotator import AsyncTokenRotator
 from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.web.async_slack_response import AsyncSlackResponse
 
 from slack_bolt.authorization.async_authorize_args import AsyncAuthorizeArgs
 from slack_bolt.authorization import AuthorizeResult
 from slack_bolt.context.async_context import AsyncBoltContext
 from slack_bolt.error import BoltError
+from slack_bolt.util.async_ttl_cache import AsyncShardedTTLCache
+from slack_bolt.util.ttl_cache import TTLCache
 
 
 class AsyncAuthorize:
@@ -39,12 +43,39 @@ class AsyncCallableAuthorize(AsyncAuthorize):
     This authorize implementation will be used.
     """
 
+    # Functions that build the value of each built-in argument
+    # from (context, enterprise_id, team_id, user_id)
+    _builtin_kwarg_builders: Dict[
+        str,
+        Callable[[AsyncBoltContext, Optional[str], Optional[str], Optional[str]], Any],
+    ] = {
+        "args": lambda c, e, t, u: AsyncAuthorizeArgs(
+            context=c, enterprise_id=e, team_id=t, user_id=u
+        ),
+        "logger": lambda c, e, t, u: c.logger,
+        "client": lambda c, e, t, u: c.client,
+        "context": lambda c, e, t, u: c,
+        "enterprise_id": lambda c, e, t, u: e,
+        "team_id": lambda c, e, t, u: t,
+        "user_id": lambda c, e, t, u: u,
+    }
+
     def __init__(
         self, *, logger: Logger, func: Callable[..., Awaitable[AuthorizeResult]]
     ):
         self.logger = logger
         self.func = func
         self.arg_names = inspect.getfullargspec(func).args
+        # The shape of the function call never changes, so it's resolved only once here
+        self._kwarg_builders = [
+            (name, self._builtin_kwarg_builders[name])
+            for name in self.arg_names
+            if name in self._builtin_kwarg_builders
+        ]
+        self._context_arg_names_in_use: List[str] = [
+            name for name in self.arg_names if name not in self._builtin_kwarg_builders
+        ]
+        self._warned_arg_names: Set[str] = set()
 
     async def __call__(
         self,
@@ -55,31 +86,17 @@ class AsyncCallableAuthorize(AsyncAuthorize):
         user_id: Optional[str],
     ) -> Optional[AuthorizeResult]:
         try:
-            all_available_args = {
-                "args": AsyncAuthorizeArgs(
-                    context=context,
-                    enterprise_id=enterprise_id,
-                    team_id=team_id,
-                    user_id=user_id,
-                ),
-                "logger": context.logger,
-                "client": context.client,
-                "context": context,
-                "enterprise_id": enterprise_id,
-                "team_id": team_id,
-                "user_id": user_id,
-            }
-            for k, v in context.items():
-                if k not in all_available_args:
-                    all_available_args[k] = v
-
-            kwargs: Dict[str, Any] = {  # type: ignore
-                k: v for k, v in all_available_args.items() if k in self.arg_names  # type: ignore
+            kwargs: Dict[str, Any] = {
+                name: build(context, enterprise_id, team_id, user_id)
+                for name, build in self._kwarg_builders
             }
-            found_arg_names = kwargs.keys()
-            for name in self.arg_names:
-                if name not in found_arg_names:
-                    self.logger.warning(f"{name} is not a valid argument")
+            for name in self._context_arg_names_in_use:
+                if name in context:
+                    kwargs[name] = context[name]
+                else:
+                    if name not in self._warned_arg_names:
+                        self._warned_arg_names.add(name)
+                        self.logger.warning(f"{name} is not a valid argument")
                     kwargs[name] = None
 
             auth_result: Optional[AuthorizeResult] = await self.func(**kwargs)
@@ -94,8 +111,11 @@ class AsyncCallableAuthorize(AsyncAuthorize):
                 )
         except SlackApiError as err:
             self.logger.debug(
-                f"The stored bot token for enterprise_id: {enterprise_id} team_id: {team_id} "
-                f"is no longer valid. (response: {err.response})"
+                "The stored bot token for enterprise_id: %s team_id: %s "
+                "is no longer valid. (response: %s)",
+                enterprise_id,
+                team_id,
+                err.response,
             )
             return None
 
@@ -106,9 +126,9 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
     you can expect that the authorize layer should work for you without any customization.
     """
 
-    authorize_result_cache: Dict[str, AuthorizeResult]
-    find_installation_available: Optional[bool]
-    find_bot_available: Optional[bool]
+    authorize_result_cache: AsyncShardedTTLCache
+    find_installation_available: bool
+    find_bot_available: bool
     token_rotator: Optional[AsyncTokenRotator]
 
     _config_error_message: str = "AsyncInstallationStore with client_id/client_secret are required for token rotation"
@@ -125,15 +145,42 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
         # use only InstallationStore#find_bot(enterprise_id, team_id)
         bot_only: bool = False,
         cache_enabled: bool = False,
+        # The max number of cached AuthorizeResult objects and their lifetime in seconds;
+        # an expired entry is verified again by calling auth.test API
+        cache_max_size: int = 1000,
+        cache_ttl_seconds: int = 600,
+        # If True, the cache lifetime gets shorter when the cache is almost full
+        cache_pressure_aware: bool = False,
+        # How long (in seconds) the absence of installation data is cached when cache_enabled is True
+        negative_cache_ttl_seconds: int = 30,
         client: Optional[AsyncWebClient] = None,
     ):
         self.logger = logger
         self.installation_store = installation_store
         self.bot_only = bot_only
         self.cache_enabled = cache_enabled
-        self.authorize_result_cache = {}
-        self.find_installation_available = None
-        self.find_bot_available = None
+        self.authorize_result_cache = AsyncShardedTTLCache(
+            max_size=cache_max_size,
+            ttl_seconds=cache_ttl_seconds,
+            pressure_aware=cache_pressure_aware,
+        )
+        # Futures of the in-flight auth.test API calls, which resolve to AuthorizeResult objects.
+        # They are kept outside authorize_result_cache so that they never expire or get evicted
+        # while the API call is running; only the request that created each one removes it.
+        self._pending_auth_tests: Dict[str, asyncio.Future] = {}
+        self._negative_cache = TTLCache(
+            max_size=2048,
+            ttl_seconds=negative_cache_ttl_seconds,
+        )
+        # Bound methods (or None) are resolved here to avoid attribute lookups for every request
+        self._async_find_installation: Optional[
+            Callable[..., Awaitable[Optional[Installation]]]
+        ] = getattr(installation_store, "async_find_installation", None)
+        self._async_find_bot: Optional[
+            Callable[..., Awaitable[Optional[Bot]]]
+        ] = getattr(installation_store, "async_find_bot", None)
+        self.find_installation_available = self._async_find_installation is not None
+        self.find_bot_available = self._async_find_bot is not None
         if client_id is not None and client_secret is not None:
             self.token_rotator = AsyncTokenRotator(
                 client_id=client_id,
@@ -155,15 +202,21 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
         user_id: Optional[str],
     ) -> Optional[AuthorizeResult]:
 
-        if self.find_installation_available is None:
-            self.find_installation_available = hasattr(
-                self.installation_store, "async_find_installation"
-            )
-        if self.find_bot_available is None:
-            self.find_bot_available = hasattr(self.installation_store, "async_find_bot")
+        negative_cache_key = (
+            enterprise_id,
+            team_id,
+            user_id,
+            bool(context.is_enterprise_install),
+        )
+        if self.cache_enabled and negative_cache_key in self._negative_cache:
+            # Recently confirmed that there is no installation data for this request
+            self._debug_log_for_not_found(enterprise_id, team_id)
+            return None
 
         bot_token: Optional[str] = None
         user_token: Optional[str] = None
+        # True if the installation store failed to respond (e.g., a database outage)
+        lookup_failed = False
 
         if not self.bot_only and self.find_installation_available:
             # Since v1.1, this is the default way.
@@ -173,7 +226,7 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
                 # The installer may not be the user associated with this incoming request.
                 latest_installation: Optional[
                     Installation
-                ] = await self.installation_store.async_find_installation(
+                ] = await self._async_find_installation(
                     enterprise_id=enterprise_id,
                     team_id=team_id,
                     is_enterprise_install=context.is_enterprise_install,
@@ -199,13 +252,11 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
 
                         # try to fetch the request user's installation
                         # to reflect the user's access token if exists
-                        this_user_installation = (
-                            await self.installation_store.async_find_installation(
-                                enterprise_id=enterprise_id,
-                                team_id=team_id,
-                                user_id=user_id,
-                                is_enterprise_install=context.is_enterprise_install,
-                            )
+                        this_user_installation = await self._async_find_installation(
+                            enterprise_id=enterprise_id,
+                            team_id=team_id,
+                            user_id=user_id,
+                            is_enterprise_install=context.is_enterprise_install,
                         )
                         if this_user_installation is not None:
                             user_token = this_user_installation.user_token
@@ -214,43 +265,50 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
                                 bot_token = this_user_installation.bot_token
 
                             # If token rotation is enabled, running rotation may be needed here
-                            refreshed = await self._rotate_and_save_tokens_if_necessary(
-                                this_user_installation
-                            )
-                            if refreshed is not None:
-                                user_token = refreshed.user_token
-                                if latest_installation.bot_token is None:
-                                    # If latest_installation has a bot token, we never overwrite the value
-                                    bot_token = refreshed.bot_token
+                            # (checking the refresh tokens here saves a coroutine call in most cases)
+                            if (
+                                this_user_installation.user_refresh_token is not None
+                                or this_user_installation.bot_refresh_token is not None
+                            ):
+                                refreshed = (
+                                    await self._rotate_and_save_tokens_if_necessary(
+                                        this_user_installation
+                                    )
+                                )
+                                if refreshed is not None:
+                                    user_token = refreshed.user_token
+                                    if latest_installation.bot_token is None:
+                                        # If latest_installation has a bot token, we never overwrite the value
+                                        bot_token = refreshed.bot_token
 
                     # If token rotation is enabled, running rotation may be needed here
-                    refreshed = await self._rotate_and_save_tokens_if_necessary(
-                        latest_installation
-                    )
-                    if refreshed is not None:
-                        bot_token = refreshed.bot_token
-                        if this_user_installation is None:
-                            # Only when we don't have `this_user_installation` here,
-                            # the `user_token` is for the user associated with this request
-                            user_token = refreshed.user_token
+                    if (
+                        latest_installation.user_refresh_token is not None
+                        or latest_installation.bot_refresh_token is not None
+                    ):
+                        refreshed = await self._rotate_and_save_tokens_if_necessary(
+                            latest_installation
+                        )
+                        if refreshed is not None:
+                            bot_token = refreshed.bot_token
+                            if this_user_installation is None:
+                                # Only when we don't have `this_user_installation` here,
+                                # the `user_token` is for the user associated with this request
+                                user_token = refreshed.user_token
 
             except NotImplementedError as _:
                 self.find_installation_available = False
 
-        if (
+        if self.find_bot_available and (
             # If you intentionally use only `find_bot` / `delete_bot`,
             self.bot_only
             # If the `find_installation` method is not available,
             or not self.find_installation_available
             # If the `find_installation` method did not return data and find_bot method is available,
-            or (
-                self.find_bot_available is True
-                and bot_token is None
-                and user_token is None
-            )
+            or (bot_token is None and user_token is None)
         ):
             try:
-                bot: Optional[Bot] = await self.installation_store.async_find_bot(
+                bot: Optional[Bot] = await self._async_find_bot(
                     enterprise_id=enterprise_id,
                     team_id=team_id,
                     is_enterprise_install=context.is_enterprise_install,
@@ -273,33 +331,85 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
                 self.find_bot_available = False
             except Exception as e:
                 self.logger.info(f"Failed to call find_bot method: {e}")
+                lookup_failed = True
 
         token: Optional[str] = bot_token or user_token
         if token is None:
             # No valid token was found
             self._debug_log_for_not_found(enterprise_id, team_id)
+            if self.cache_enabled and not lookup_failed:
+                self._negative_cache.set(negative_cache_key, True)
             return None
 
         # Check cache to see if the bot object already exists
-        if self.cache_enabled and token in self.authorize_result_cache:
-            return self.authorize_result_cache[token]
+        # While an auth.test API call for a token is in flight, its Future is kept
+        # so that concurrent requests for the same token wait for the result instead of calling the API again
+        pending: Optional[asyncio.Future] = None
+        if self.cache_enabled:
+            segment, lock = self.authorize_result_cache.segment_for(token)
+            while True:
+                async with lock:
+                    cached: Optional[AuthorizeResult] = segment.get(token)
+                    in_flight: Optional[asyncio.Future] = None
+                    if cached is None:
+                        in_flight = self._pending_auth_tests.get(token)
+                        if in_flight is None:
+                            pending = asyncio.get_event_loop().create_future()
+                            self._pending_auth_tests[token] = pending
+                if in_flight is None:
+                    break
+                try:
+                    # shield: cancelling this request must not cancel the other request's API call
+                    return await asyncio.shield(in_flight)
+                except SlackApiError as err:
+                    self._debug_log_for_invalid_token(enterprise_id, team_id, err)
+                    return None
+                except asyncio.CancelledError:
+                    if not in_flight.cancelled():
+                        # This request itself has been cancelled
+                        raise
+                    # The request calling auth.test was cancelled; look up the cache again
+            if cached is not None:
+                return cached
 
         try:
+            # The API call is made outside the cache's locks
+            # so that concurrent requests for other tokens never wait for it
             auth_test_api_response = await context.client.auth_test(token=token)
-            authorize_result = AuthorizeResult.from_auth_test_response(
+            authorize_result = self._build_authorize_result(
                 auth_test_response=auth_test_api_response,
                 bot_token=bot_token,
                 user_token=user_token,
             )
-            if self.cache_enabled:
-                self.authorize_result_cache[token] = authorize_result
-            return authorize_result
-        except SlackApiError as err:
-            self.logger.debug(
-                f"The stored bot token for enterprise_id: {enterprise_id} team_id: {team_id} "
-                f"is no longer valid. (response: {err.response})"
-            )
-            return None
+        except BaseException as e:
+            if pending is not None:
+                # Don't await anything here as this task may be being cancelled
+                if self._pending_auth_tests.get(token) is pending:
+                    del self._pending_auth_tests[token]
+                if isinstance(e, asyncio.CancelledError):
+                    # Only this request has been cancelled; the waiters retry by themselves
+                    pending.cancel()
+                else:
+                    # The waiters fail with the same error right away
+                    # instead of calling auth.test again one after another
+                    pending.set_exception(e)
+                    # Mark the exception as retrieved in case there are no waiters
+                    pending.exception()
+            if isinstance(e, SlackApiError):
+                self._debug_log_for_invalid_token(enterprise_id, team_id, e)
+                return None
+            raise
+
+        if pending is not None:
+            # Resolve the Future first so that the waiters never hang even if this task is cancelled
+            pending.set_result(authorize_result)
+            async with lock:
+                if self._pending_auth_tests.get(token) is pending:
+                    del self._pending_auth_tests[token]
+                # Never overwrite a newer result saved by another request
+                if segment.get(token) is None:
+                    segment.set(token, authorize_result)
+        return authorize_result
 
     # ------------------------------------------------
 
@@ -307,8 +417,36 @@ class AsyncInstallationStoreAuthorize(AsyncAuthorize):
         self, enterprise_id: Optional[str], team_id: Optional[str]
     ):
         self.logger.debug(
-            "No installation data found "
-            f"for enterprise_id: {enterprise_id} team_id: {team_id}"
+            "No installation data found for enterprise_id: %s team_id: %s",
+            enterprise_id,
+            team_id,
+        )
+
+    def _build_authorize_result(
+        self,
+        *,
+        auth_test_response: AsyncSlackResponse,
+        bot_token: Optional[str],
+        user_token: Optional[str],
+    ) -> AuthorizeResult:
+        return AuthorizeResult.from_auth_test_response(
+            auth_test_response=auth_test_response,
+            bot_token=bot_token,
+            user_token=user_token,
+        )
+
+    def _debug_log_for_invalid_token(
+        self,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        err: SlackApiError,
+    ):
+        self.logger.debug(
+            "The stored bot token for enterprise_id: %s team_id: %s "
+            "is no longer valid. (response: %s)",
+            enterprise_id,
+            team_id,
+            err.response,
         )
 
     async def _rotate_and_save_tokens_if_necessary(
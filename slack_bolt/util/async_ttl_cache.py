@@ -0,0 +1,78 @@
+import asyncio
+from typing import Hashable, List, Optional, Tuple
+
+from slack_bolt.util.ttl_cache import TTLCache
+
+
+class AsyncShardedTTLCache:
+    """A TTLCache partitioned into segments, each of which has its own asyncio.Lock.
+
+    A key always belongs to the segment at `hash(key) & (num_segments - 1)`.
+    Each segment evicts its least recently used entry on its own when it's full,
+    so an entry may be evicted before the whole cache reaches max_size.
+
+    The locks must be held only while touching the segments; never await I/O while holding them.
+    As long as the code inside `async with lock` is synchronous, the locks never contend
+    under asyncio. They only mark the critical sections, which matters if the code there
+    ever starts awaiting something.
+    """
+
+    max_size: int
+    segments: List[TTLCache]
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        num_segments: int = 32,
+        pressure_aware: bool = False,
+    ):
+        """
+        Args:
+            max_size: The maximum number of entries to keep (shared among all the segments)
+            ttl_seconds: The lifetime of each entry in seconds
+            num_segments: The number of segments, which must be a power of two;
+                fewer segments are used when max_size is smaller than this value
+            pressure_aware: If True, new entries get shorter lifetimes as the whole cache gets full
+        """
+        if num_segments < 1 or num_segments & (num_segments - 1) != 0:
+            raise ValueError(
+                f"num_segments must be a power of two (given: {num_segments})"
+            )
+        while num_segments > 1 and num_segments > max_size:
+            num_segments //= 2
+        self.max_size = max_size
+        # max_size is split exactly; the first segments take the remainder
+        base_size, remainder = divmod(max_size, num_segments)
+        self.segments = [
+            TTLCache(
+                max_size=base_size + (1 if i < remainder else 0),
+                ttl_seconds=ttl_seconds,
+                pressure_aware=pressure_aware,
+                usage=self._usage,
+            )
+            for i in range(num_segments)
+        ]
+        self._mask = num_segments - 1
+        # asyncio.Lock objects are created lazily
+        # because they may be bound to the event loop running when they're created
+        self._locks: List[Optional[asyncio.Lock]] = [None] * num_segments
+
+    def segment_for(self, key: Hashable) -> Tuple[TTLCache, asyncio.Lock]:
+        index = hash(key) & self._mask
+        lock = self._locks[index]
+        if lock is None:
+            lock = self._locks[index] = asyncio.Lock()
+        return self.segments[index], lock
+
+    def _usage(self) -> float:
+        # The fill level of the whole cache, not of a single segment
+        return len(self) / self.max_size if self.max_size > 0 else 1.0
+
+    def clear(self) -> None:
+        for segment in self.segments:
+            segment.clear()
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self.segments)
@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """A bounded in-memory cache whose entries expire after a fixed time-to-live.
+
+    When the cache is full, the least recently used entry is evicted first.
+    Each entry holds its own expiration time, so no background cleanup task is required.
+    """
+
+    max_size: int
+    ttl_seconds: float
+    pressure_aware: bool
+    min_ttl_seconds: float
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        pressure_aware: bool = False,
+        min_ttl_seconds: float = 30,
+        usage: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Args:
+            max_size: The maximum number of entries to keep
+            ttl_seconds: The lifetime of each entry in seconds
+            pressure_aware: If True, new entries get shorter lifetimes as the cache gets close to max_size
+            min_ttl_seconds: The lower limit of the shortened lifetime when pressure_aware is True
+            usage: A function that returns the fill level (0.0 - 1.0) used when pressure_aware is True;
+                by default, the fill level of this cache is used
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.pressure_aware = pressure_aware
+        self.min_ttl_seconds = min_ttl_seconds
+        self._usage = usage
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (
+            value,
+            time.monotonic() + self._ttl_seconds_for_new_entry(),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        entry = self._entries.pop(key, None)
+        return entry[0] if entry is not None else default
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _ttl_seconds_for_new_entry(self) -> float:
+        if not self.pressure_aware:
+            return self.ttl_seconds
+        # The lifetime linearly shrinks while the usage grows from 70% to 90% of max_size.
+        # The existing entries keep their expiration time.
+        if self._usage is not None:
+            usage = self._usage()
+        else:
+            usage = len(self._entries) / self.max_size if self.max_size > 0 else 1.0
+        pressure = min(1.0, max(0.0, (usage - 0.7) / (0.9 - 0.7)))
+        return max(
+            min(self.min_ttl_seconds, self.ttl_seconds),
+            self.ttl_seconds * (1 - pressure),
+        )
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() < entry[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
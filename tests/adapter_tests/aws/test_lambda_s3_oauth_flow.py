@@ -1,3 +1,4 @@
+import boto3
 from moto import mock_s3
 
 from slack_bolt.adapter.aws_lambda.lambda_s3_oauth_flow import LambdaS3OAuthFlow
@@ -26,3 +27,20 @@ class TestLambdaS3OAuthFlow:
         assert oauth_flow is not None
         assert oauth_flow.client is not None
         assert oauth_flow.logger is not None
+
+    @mock_s3
+    def test_instantiation_with_s3_client(self):
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        oauth_flow = LambdaS3OAuthFlow(
+            settings=OAuthSettings(
+                client_id="111.222",
+                client_secret="xxx",
+                scopes=["chat:write"],
+            ),
+            installation_bucket_name="dummy-installation",
+            oauth_state_bucket_name="dummy-state",
+            s3_client=s3_client,
+        )
+        assert oauth_flow.s3_client is s3_client
+        assert oauth_flow.settings.state_store.s3_client is s3_client
+        assert oauth_flow.settings.installation_store.s3_client is s3_client
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from slack_bolt.util.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_and_set(self):
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+        assert cache.pop("a") == 1
+        assert cache.get("a") is None
+
+    def test_expiration(self):
+        cache = TTLCache(max_size=10, ttl_seconds=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        assert "a" not in cache
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now the least recently used
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_pressure_aware(self):
+        cache = TTLCache(
+            max_size=10, ttl_seconds=600, pressure_aware=True, min_ttl_seconds=30
+        )
+        for i in range(7):
+            cache.set(i, i)
+        # 70% used
+        assert cache._ttl_seconds_for_new_entry() == 600
+        cache.set(7, 7)
+        # 80% used
+        assert cache._ttl_seconds_for_new_entry() == pytest.approx(300)
+        cache.set(8, 8)
+        # 90% used
+        assert cache._ttl_seconds_for_new_entry() == 30
+
+    def test_not_pressure_aware(self):
+        cache = TTLCache(max_size=10, ttl_seconds=600)
+        for i in range(9):
+            cache.set(i, i)
+        assert cache._ttl_seconds_for_new_entry() == 600
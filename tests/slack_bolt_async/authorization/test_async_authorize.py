@@ -1,6 +1,7 @@
 import asyncio
 import datetime
 import logging
+import time
 from logging import Logger
 from typing import Optional
 
@@ -11,9 +12,11 @@ from slack_sdk.oauth.installation_store.async_installation_store import (
 )
 from slack_sdk.web.async_client import AsyncWebClient
 
+from slack_bolt.authorization import AuthorizeResult
 from slack_bolt.authorization.async_authorize import (
     AsyncInstallationStoreAuthorize,
     AsyncAuthorize,
+    AsyncCallableAuthorize,
 )
 from slack_bolt.context.async_context import AsyncBoltContext
 from slack_bolt.error import BoltError
@@ -54,13 +57,49 @@ class TestAsyncAuthorize:
                 user_id="U111",
             )
 
+    @pytest.mark.asyncio
+    async def test_callable(self):
+        received_kwargs = []
+
+        async def func(enterprise_id, team_id, context, foo, unknown):
+            received_kwargs.append(
+                {
+                    "enterprise_id": enterprise_id,
+                    "team_id": team_id,
+                    "context": context,
+                    "foo": foo,
+                    "unknown": unknown,
+                }
+            )
+            return AuthorizeResult(enterprise_id=enterprise_id, team_id=team_id)
+
+        authorize = AsyncCallableAuthorize(
+            logger=logging.getLogger(__name__), func=func
+        )
+        context = AsyncBoltContext()
+        context["foo"] = "bar"
+        for _ in range(2):
+            result = await authorize(
+                context=context, enterprise_id="E111", team_id="T111", user_id="U111"
+            )
+            assert result.enterprise_id == "E111"
+            assert result.team_id == "T111"
+        assert received_kwargs[0] == {
+            "enterprise_id": "E111",
+            "team_id": "T111",
+            "context": context,
+            "foo": "bar",
+            "unknown": None,
+        }
+        assert received_kwargs[1] == received_kwargs[0]
+
     @pytest.mark.asyncio
     async def test_installation_store_legacy(self):
         installation_store = LegacyMemoryInstallationStore()
         authorize = AsyncInstallationStoreAuthorize(
             logger=installation_store.logger, installation_store=installation_store
         )
-        assert authorize.find_installation_available is None
+        assert authorize.find_installation_available is True
         context = AsyncBoltContext()
         context["client"] = self.client
         result = await authorize(
@@ -88,7 +127,7 @@ class TestAsyncAuthorize:
             installation_store=installation_store,
             cache_enabled=True,
         )
-        assert authorize.find_installation_available is None
+        assert authorize.find_installation_available is True
         context = AsyncBoltContext()
         context["client"] = self.client
         result = await authorize(
@@ -116,7 +155,7 @@ class TestAsyncAuthorize:
             installation_store=installation_store,
             bot_only=True,
         )
-        assert authorize.find_installation_available is None
+        assert authorize.find_installation_available is True
         assert authorize.bot_only is True
         context = AsyncBoltContext()
         context["client"] = self.client
@@ -146,7 +185,7 @@ class TestAsyncAuthorize:
             cache_enabled=True,
             bot_only=True,
         )
-        assert authorize.find_installation_available is None
+        assert authorize.find_installation_available is True
         assert authorize.bot_only is True
         context = AsyncBoltContext()
         context["client"] = self.client
@@ -173,7 +212,7 @@ class TestAsyncAuthorize:
         authorize = AsyncInstallationStoreAuthorize(
             logger=installation_store.logger, installation_store=installation_store
         )
-        assert authorize.find_installation_available is None
+        assert authorize.find_installation_available is True
         context = AsyncBoltContext()
         context["client"] = self.client
         result = await authorize(
@@ -193,6 +232,23 @@ class TestAsyncAuthorize:
         assert result.user_token == "xoxp-valid"
         await assert_auth_test_count_async(self, 2)
 
+    @pytest.mark.asyncio
+    async def test_installation_store_find_installation_disabled(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger, installation_store=installation_store
+        )
+        assert authorize.find_installation_available is True
+        authorize.find_installation_available = False
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        result = await authorize(
+            context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111"
+        )
+        # find_bot is used instead
+        assert result.bot_token == "xoxb-valid"
+        assert result.user_token is None
+
     @pytest.mark.asyncio
     async def test_installation_store_cached(self):
         installation_store = MemoryInstallationStore()
@@ -201,7 +257,7 @@ class TestAsyncAuthorize:
             installation_store=installation_store,
             cache_enabled=True,
         )
-        assert authorize.find_installation_available is None
+        assert authorize.find_installation_available is True
         context = AsyncBoltContext()
         context["client"] = self.client
         result = await authorize(
@@ -221,6 +277,309 @@ class TestAsyncAuthorize:
         assert result.user_token == "xoxp-valid"
         await assert_auth_test_count_async(self, 1)  # cached
 
+    @pytest.mark.asyncio
+    async def test_installation_store_cache_expiration(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+            cache_ttl_seconds=0,
+        )
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        result = await authorize(
+            context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111"
+        )
+        assert result.bot_id == "BZYBOTHED"
+        await assert_auth_test_count_async(self, 1)
+
+        result = await authorize(
+            context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111"
+        )
+        assert result.bot_id == "BZYBOTHED"
+        await assert_auth_test_count_async(self, 2)  # expired
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cache_pressure_aware(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+            cache_max_size=320,  # 10 entries per segment
+            cache_pressure_aware=True,
+        )
+        cache = authorize.authorize_result_cache
+        token_segment, _ = cache.segment_for("xoxb-valid-2")
+        # Fill only the token's segment up to 90%; the whole cache is still almost empty
+        fill_segments(cache, [token_segment], 9)
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        await authorize(
+            context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111"
+        )
+        ttl = token_segment._entries["xoxb-valid-2"][1] - time.monotonic()
+        assert ttl > 590
+
+        # Fill every segment up to 90%
+        cache.clear()
+        fill_segments(cache, cache.segments, 9)
+        assert len(cache) == 288
+        await authorize(
+            context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111"
+        )
+        ttl = token_segment._entries["xoxb-valid-2"][1] - time.monotonic()
+        assert ttl <= 30
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cached_concurrent_requests(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        results = await asyncio.gather(
+            *[
+                authorize(
+                    context=context,
+                    enterprise_id="E111",
+                    team_id="T0G9PQBBK",
+                    user_id="W11111",
+                )
+                for _ in range(5)
+            ]
+        )
+        for result in results:
+            assert result.bot_id == "BZYBOTHED"
+            assert result.user_token == "xoxp-valid"
+        await assert_auth_test_count_async(self, 1)  # deduplicated
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cache_lock_not_held_during_auth_test(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        client = SlowAuthTestClient()
+        context = AsyncBoltContext()
+        context["client"] = client
+        task = asyncio.ensure_future(
+            authorize(
+                context=context,
+                enterprise_id="E111",
+                team_id="T0G9PQBBK",
+                user_id="W11111",
+            )
+        )
+        await client.started.wait()
+        segment, lock = authorize.authorize_result_cache.segment_for("xoxb-valid-2")
+        assert lock.locked() is False
+        assert segment.get("xoxb-valid-2") is None
+        assert "xoxb-valid-2" in authorize._pending_auth_tests
+
+        client.released.set()
+        result = await task
+        assert result.bot_id == "BZYBOTHED"
+        assert segment.get("xoxb-valid-2") is result
+        assert authorize._pending_auth_tests == {}
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cached_in_flight_never_expires(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+            cache_max_size=1,
+            cache_ttl_seconds=0,
+        )
+        client = SlowAuthTestClient()
+        context = AsyncBoltContext()
+        context["client"] = client
+
+        def run_authorize():
+            return asyncio.ensure_future(
+                authorize(
+                    context=context,
+                    enterprise_id="E111",
+                    team_id="T0G9PQBBK",
+                    user_id="W11111",
+                )
+            )
+
+        owner = run_authorize()
+        await client.started.wait()
+        # Fill the only segment so that any entry stored there would be evicted
+        segment, _ = authorize.authorize_result_cache.segment_for("xoxb-valid-2")
+        segment.set("xoxb-other", "other")
+        waiter = run_authorize()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert client.call_count == 1  # the waiter is still waiting for the owner
+
+        client.released.set()
+        results = await asyncio.gather(owner, waiter)
+        assert results[0] is results[1]
+        assert client.call_count == 1
+        assert authorize._pending_auth_tests == {}
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cached_newer_result_kept(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        client = SlowAuthTestClient()
+        context = AsyncBoltContext()
+        context["client"] = client
+        task = asyncio.ensure_future(
+            authorize(
+                context=context,
+                enterprise_id="E111",
+                team_id="T0G9PQBBK",
+                user_id="W11111",
+            )
+        )
+        await client.started.wait()
+        segment, _ = authorize.authorize_result_cache.segment_for("xoxb-valid-2")
+        newer_result = AuthorizeResult(
+            enterprise_id="E111", team_id="T0G9PQBBK", bot_token="xoxb-valid-2"
+        )
+        segment.set("xoxb-valid-2", newer_result)
+
+        client.released.set()
+        result = await task
+        assert result is not newer_result
+        assert segment.get("xoxb-valid-2") is newer_result
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cached_owner_cancelled(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        client = SlowAuthTestClient()
+        context = AsyncBoltContext()
+        context["client"] = client
+
+        def run_authorize():
+            return asyncio.ensure_future(
+                authorize(
+                    context=context,
+                    enterprise_id="E111",
+                    team_id="T0G9PQBBK",
+                    user_id="W11111",
+                )
+            )
+
+        owner = run_authorize()
+        await client.started.wait()
+        waiter = run_authorize()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert client.call_count == 1  # the waiter is waiting for the owner
+
+        owner.cancel()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert owner.cancelled() is True
+        assert waiter.done() is False
+        assert client.call_count == 2  # the waiter calls auth.test by itself
+
+        client.released.set()
+        result = await waiter
+        assert result.bot_id == "BZYBOTHED"
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cached_concurrent_failures(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        client = FailingAuthTestClient(delay=0.2)
+        context = AsyncBoltContext()
+        context["client"] = client
+
+        started_at = time.monotonic()
+        results = await asyncio.gather(
+            *[
+                authorize(
+                    context=context,
+                    enterprise_id="E111",
+                    team_id="T0G9PQBBK",
+                    user_id="W11111",
+                )
+                for _ in range(5)
+            ],
+            return_exceptions=True,
+        )
+        elapsed = time.monotonic() - started_at
+        assert client.call_count == 1
+        for result in results:
+            assert isinstance(result, ConnectionError)
+        # All the requests fail in a single round-trip
+        assert elapsed < 0.4
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cached_not_found(self):
+        installation_store = NotFoundInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        for _ in range(3):
+            result = await authorize(
+                context=context,
+                enterprise_id="E111",
+                team_id="T0G9PQBBK",
+                user_id="W11111",
+            )
+            assert result is None
+        # find_installation + find_bot only for the first request
+        assert installation_store.find_count == 2
+
+        result = await authorize(
+            context=context, enterprise_id="E111", team_id="T222", user_id="W11111"
+        )
+        assert result is None
+        assert installation_store.find_count == 4
+
+    @pytest.mark.asyncio
+    async def test_installation_store_cached_find_bot_error(self):
+        installation_store = FailingFindBotInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        for _ in range(2):
+            result = await authorize(
+                context=context,
+                enterprise_id="E111",
+                team_id="T0G9PQBBK",
+                user_id="W11111",
+            )
+            assert result is None
+        # A failure is never cached as the absence of installation data
+        assert installation_store.find_count == 4
+
     @pytest.mark.asyncio
     async def test_fetch_different_user_token(self):
         installation_store = ValidUserTokenInstallationStore()
@@ -273,6 +632,45 @@ class TestAsyncAuthorize:
         await assert_auth_test_count_async(self, 1)
 
 
+def fill_segments(cache, segments, num_entries_per_segment: int):
+    i = 0
+    while any(len(segment) < num_entries_per_segment for segment in segments):
+        key = f"dummy-{i}"
+        segment, _ = cache.segment_for(key)
+        if segment in segments and len(segment) < num_entries_per_segment:
+            segment.set(key, True)
+        i += 1
+
+
+class SlowAuthTestClient:
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.released = asyncio.Event()
+        self.call_count = 0
+
+    async def auth_test(self, token: str):
+        self.call_count += 1
+        self.started.set()
+        await self.released.wait()
+        return {
+            "ok": True,
+            "team_id": "T0G9PQBBK",
+            "user_id": "W23456789",
+            "bot_id": "BZYBOTHED",
+        }
+
+
+class FailingAuthTestClient:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.call_count = 0
+
+    async def auth_test(self, token: str):
+        self.call_count += 1
+        await asyncio.sleep(self.delay)
+        raise ConnectionError("Failed to connect to Slack")
+
+
 class LegacyMemoryInstallationStore(AsyncInstallationStore):
     @property
     def logger(self) -> Logger:
@@ -336,6 +734,51 @@ class BotOnlyMemoryInstallationStore(LegacyMemoryInstallationStore):
         raise ValueError
 
 
+class NotFoundInstallationStore(AsyncInstallationStore):
+    def __init__(self):
+        self.find_count = 0
+
+    @property
+    def logger(self) -> Logger:
+        return logging.getLogger(__name__)
+
+    async def async_save(self, installation: Installation):
+        pass
+
+    async def async_find_bot(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[Bot]:
+        self.find_count += 1
+        return None
+
+    async def async_find_installation(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        user_id: Optional[str] = None,
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[Installation]:
+        self.find_count += 1
+        return None
+
+
+class FailingFindBotInstallationStore(NotFoundInstallationStore):
+    async def async_find_bot(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[Bot]:
+        self.find_count += 1
+        raise ConnectionError("The database is temporarily unavailable")
+
+
 class ValidUserTokenInstallationStore(AsyncInstallationStore):
     @property
     def logger(self) -> Logger:
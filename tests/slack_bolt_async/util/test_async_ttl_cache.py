@@ -0,0 +1,41 @@
+import pytest
+
+from slack_bolt.util.async_ttl_cache import AsyncShardedTTLCache
+
+
+class TestAsyncShardedTTLCache:
+    def test_invalid_num_segments(self):
+        with pytest.raises(ValueError):
+            AsyncShardedTTLCache(max_size=10, ttl_seconds=60, num_segments=3)
+
+    def test_max_size(self):
+        cache = AsyncShardedTTLCache(max_size=1000, ttl_seconds=60)
+        assert len(cache.segments) == 32
+        assert sum(segment.max_size for segment in cache.segments) == 1000
+        assert cache.segments[0].max_size == 32
+        assert cache.segments[-1].max_size == 31
+
+        cache = AsyncShardedTTLCache(max_size=1, ttl_seconds=60)
+        assert len(cache.segments) == 1
+        assert cache.segments[0].max_size == 1
+
+        cache = AsyncShardedTTLCache(max_size=20, ttl_seconds=60)
+        assert len(cache.segments) == 16
+        assert sum(segment.max_size for segment in cache.segments) == 20
+
+    @pytest.mark.asyncio
+    async def test_segments(self):
+        cache = AsyncShardedTTLCache(max_size=100, ttl_seconds=60, num_segments=4)
+        assert len(cache.segments) == 4
+        for i in range(10):
+            segment, lock = cache.segment_for(f"key-{i}")
+            async with lock:
+                segment.set(f"key-{i}", i)
+        assert len(cache) == 10
+        for i in range(10):
+            segment, _ = cache.segment_for(f"key-{i}")
+            assert segment.get(f"key-{i}") == i
+        segment, lock = cache.segment_for("key-0")
+        assert cache.segment_for("key-0") == (segment, lock)
+        cache.clear()
+        assert len(cache) == 0